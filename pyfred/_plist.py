@@ -0,0 +1,47 @@
+"""
+Reading and writing of property list files
+"""
+
+import plistlib
+from typing import IO, Any
+
+FMT_XML = plistlib.FMT_XML
+FMT_BINARY = plistlib.FMT_BINARY
+
+_BINARY_HEADER = b"bplist00"
+
+
+def detect_format(fp: IO[bytes]) -> plistlib.PlistFormat:
+    """
+    Determine the format of a property list without consuming it
+
+    :param fp: The seekable file to inspect
+    :return: `FMT_BINARY` for binary property lists; `FMT_XML` otherwise
+    """
+    position = fp.tell()
+    header = fp.read(len(_BINARY_HEADER))
+    fp.seek(position)
+
+    return FMT_BINARY if header == _BINARY_HEADER else FMT_XML
+
+
+def load(fp: IO[bytes]) -> Any:
+    """
+    Read a property list from a file opened in binary mode
+
+    :param fp: The file to read from
+    :return: the deserialised property list
+    """
+    return plistlib.load(fp)
+
+
+def dump(value: Any, fp: IO[bytes], sort_keys: bool = True, fmt: plistlib.PlistFormat = FMT_XML) -> None:
+    """
+    Write a property list to a file opened in binary mode
+
+    :param value: The object to serialise
+    :param fp: The file to write to
+    :param sort_keys: Whether to write dictionary keys in sorted order
+    :param fmt: The format of the property list, either `FMT_XML` or `FMT_BINARY`
+    """
+    plistlib.dump(value, fp, fmt=fmt, sort_keys=sort_keys)
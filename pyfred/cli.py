@@ -1,33 +1,83 @@
 import argparse
 import datetime
+import functools
 import logging
-import plistlib
-import re
+import os
+import shutil
 import stat
 import subprocess
 import sys
 from pathlib import Path
-from typing import Callable, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, Optional
 from uuid import uuid4
-from zipfile import ZIP_DEFLATED, ZipFile
 
-from jinja2 import Environment, PackageLoader
+from pyfred import _plist
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
+
+
+@functools.lru_cache(maxsize=1)
+def _cwd() -> Path:
+    """
+    :return: The working directory, looked up once per process
+    """
+    return Path.cwd()
+
+
+@functools.lru_cache(maxsize=1)
+def _home() -> Path:
+    """
+    :return: The user's home directory, looked up once per process
+    """
+    return Path.home()
 
 
 def _info_plist_path() -> Path:
-    wf_dir = Path.cwd() / "Workflow"
+    wf_dir = _cwd() / "Workflow"
     info_plist_path = wf_dir / "info.plist"
     return info_plist_path
 
 
+@functools.lru_cache(maxsize=1)
+def _git_executable() -> str:
+    """
+    :return: The path to the git executable, resolved once so that later calls skip the `PATH` lookup
+    """
+    return shutil.which("git") or "git"
+
+
+def _has_local_changes() -> bool:
+    """
+    Check whether the git working tree has uncommitted changes
+
+    Stops `git status` as soon as it reports the first change instead of waiting for the full listing. Optional locks
+    are disabled so that stopping it early can't leave a stale index lock behind.
+
+    :return: whether there are any changes
+    """
+    git_status_command = [_git_executable(), "status", "--porcelain", "-z"]
+    env = {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
+    with subprocess.Popen(git_status_command, stdout=subprocess.PIPE, env=env) as proc:
+        assert proc.stdout is not None
+        has_changes = bool(proc.stdout.read(1))
+        if has_changes:
+            proc.kill()
+
+    if not has_changes and proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, git_status_command)
+
+    return has_changes
+
+
 def _ensure_no_local_changes(
     fn: Callable[[argparse.Namespace], None],
 ) -> Callable[[argparse.Namespace], None]:
     """Ensure that there are no changes to the local directory"""
 
     def decorator(args: argparse.Namespace) -> None:
-        git_status_command = ["git", "status", "-s"]
-        if subprocess.check_output(git_status_command).decode("utf-8").strip():
+        if _has_local_changes():
             logging.critical("Local changes detected. Ensure git history has all changes committed.")
             exit(1)
 
@@ -42,7 +92,8 @@ def _must_be_run_from_workflow_project_root(
     """Validates that the command is run from a directory that contains a workflow"""
 
     def decorator(args: argparse.Namespace):
-        if not _info_plist_path().exists():
+        # A single stat() call that also rejects a missing Workflow directory
+        if not os.path.isfile(_info_plist_path()):
             logging.critical("Cannot find workflow. You need to run this command from the root of the project")
             exit(1)
 
@@ -51,17 +102,18 @@ def _must_be_run_from_workflow_project_root(
     return decorator
 
 
+@functools.lru_cache(maxsize=None)
 def _get_sync_directory() -> Optional[Path]:
     """
     :return: The path to Alfred's sync directory
     """
-    prefs_path = Path.home() / "Library" / "Preferences" / "com.runningwithcrayons.Alfred-Preferences.plist"
+    prefs_path = _home() / "Library" / "Preferences" / "com.runningwithcrayons.Alfred-Preferences.plist"
 
     if not prefs_path.exists():
         raise ValueError("Alfred doesn't appear to be installed")
 
     with prefs_path.open("rb") as f:
-        pl = plistlib.load(f)
+        pl = _plist.load(f)
 
     if "syncfolder" not in pl:
         logging.debug("Alfred's synchronisation directory not set")
@@ -75,22 +127,59 @@ def _get_sync_directory() -> Optional[Path]:
     return sync_dir.expanduser()
 
 
+@functools.lru_cache(maxsize=None)
 def _get_workflows_directory() -> Path:
     """
     Get the directory where Alfred stores workflows
 
     Finds the Alfred.alfredpreferences dir either in the sync location set in the Alfred settings or in the default
-    location.
+    location. The result is cached for the lifetime of the process.
 
     :return: The path to the directory with Alfred's workflows
     """
 
     sync_dir = _get_sync_directory()
-    prefs_dir = sync_dir or Path.home() / "Library" / "Application Support" / "Alfred/"
+    prefs_dir = sync_dir or _home() / "Library" / "Application Support" / "Alfred/"
 
     return prefs_dir / "Alfred.alfredpreferences" / "workflows"
 
 
+@functools.lru_cache(maxsize=1)
+def _template_environment() -> "Environment":
+    """
+    Get the Jinja environment for the workflow template
+
+    Compiled templates are kept in Jinja's bytecode cache in the temporary directory so that they can be reused by later
+    invocations.
+
+    :return: the environment to render the template from
+    """
+    from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader
+
+    return Environment(loader=PackageLoader("pyfred", "template"), bytecode_cache=FileSystemBytecodeCache())
+
+
+def _render_template(env: "Environment", template: str, outfile: Path, context: Mapping[str, Any]) -> None:
+    """
+    Render a template from the workflow template into a file
+
+    :param env: The environment to load the template from
+    :param template: The name of the template
+    :param outfile: The file to write the rendered template to
+    :param context: The variables to render the template with
+    """
+    env.get_template(template).stream(context).dump(str(outfile))
+
+
+@functools.lru_cache(maxsize=1)
+def _system_python_version() -> str:
+    """
+    :return: The version of the macOS system Python interpreter
+    """
+    result = subprocess.run(["/usr/bin/python3", "--version"], capture_output=True, text=True, check=True)
+    return result.stdout.split()[1]
+
+
 def _make_plist(
     name: str,
     keyword: str,
@@ -167,19 +256,50 @@ def _make_plist(
     }
 
 
-def _zip_dir(directory: Path, output_file: Path):
+_MAX_IN_MEMORY_FILE_SIZE = 1 << 20
+"""Files up to this size in bytes are read into memory in one go when packaging"""
+
+
+def _iter_files(root: str) -> Iterator[str]:
+    """
+    Recursively find the files in a directory, without following symbolic links to directories
+
+    :param root: The directory to search
+    :return: an iterator over the paths of the files
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path)
+            elif entry.is_file():
+                yield entry.path
+
+
+def _zip_dir(directory: Path, output_file: Path, compress_level: int = 6):
     """
     Zip the contents of the provided directory recursively
 
     :param directory: The directory to compress
     :param output_file: The target file
+    :param compress_level: The DEFLATE compression level, from 0 (no compression) to 9 (best compression)
     """
+    from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
+
+    root = str(directory)
 
-    with ZipFile(output_file, "w", ZIP_DEFLATED) as zip_file:
-        for entry in directory.rglob("**/*"):
-            if entry.is_file():
-                logging.debug("Adding to package: %s", entry)
-                zip_file.write(entry, entry.relative_to(directory))
+    with ZipFile(output_file, "w", ZIP_DEFLATED, compresslevel=compress_level) as zip_file:
+        for abs_path in _iter_files(root):
+            logging.debug("Adding to package: %s", abs_path)
+            zip_info = ZipInfo.from_file(abs_path, os.path.relpath(abs_path, root))
+
+            if zip_info.file_size > _MAX_IN_MEMORY_FILE_SIZE:
+                zip_file.write(abs_path, zip_info.filename)
+                continue
+
+            # Compress small files in one go instead of streaming them through the compressor in 8 KiB chunks
+            with open(abs_path, "rb") as f:
+                data = f.read()
+            zip_file.writestr(zip_info, data, compress_type=ZIP_DEFLATED, compresslevel=compress_level)
     logging.info("Produced package at %s", output_file)
 
 
@@ -190,12 +310,20 @@ def find_workflow_link(target: Path) -> Optional[Path]:
     :param target: The path to the workflow we're looking for
     :return: The path if found; `None` otherwise
     """
-    target = target.expanduser()
-    workflows = _get_workflows_directory()
-
-    for wf in workflows.iterdir():
-        if wf.is_symlink() and wf.readlink().expanduser() == target:
-            return wf
+    target_str = os.fspath(target.expanduser())
+    workflows = os.fspath(_get_workflows_directory())
+
+    with os.scandir(workflows) as it:
+        for entry in it:
+            if not entry.is_symlink():
+                continue
+            link_target = os.readlink(entry.path)
+            if link_target.startswith("~"):
+                link_target = os.path.expanduser(link_target)
+            # Links created by pyfred are absolute, so a plain string comparison is enough in most cases. Otherwise,
+            # normalise the link target lexically, which avoids the syscalls of resolving it.
+            if link_target == target_str or os.path.normpath(os.path.join(workflows, link_target)) == target_str:
+                return Path(entry.path)
 
     return None
 
@@ -212,6 +340,7 @@ def new(args: argparse.Namespace):
                       [--website WEBSITE] [--description DESCRIPTION]
                       [--git | --no-git] [--link | --no-link]
                       [--vendor | --no-vendor]
+                      [--binary-plist | --no-binary-plist]
                       name
 
     positional arguments:
@@ -231,36 +360,47 @@ def new(args: argparse.Namespace):
       --link, --no-link     Create a symbolic link to this workflow
       --vendor, --no-vendor
                             Install workflow dependencies
+      --binary-plist, --no-binary-plist
+                            Write info.plist in the binary format instead of XML
     ```
     """  # noqa: E501
     name = args.name
     logging.info("Creating new workflow: %s", name)
 
-    root_dir = Path.cwd().joinpath(name)
+    root_dir = _cwd().joinpath(name)
     wf_dir = root_dir.joinpath("Workflow")
 
-    context = {
-        "year": datetime.datetime.now().year,
-        "system_python_version": subprocess.check_output(
-            ["/usr/bin/python3", "-c", "print(__import__('platform').python_version())"]
-        )
-        .decode("utf-8")
-        .strip(),
-        **vars(args),
-    }
-    try:
-        logging.debug("Copying template")
-        env = Environment(loader=PackageLoader("pyfred", "template"))
-        logging.debug("Generating templates from %s to %s", env.list_templates(), root_dir)
-        for t in [t for t in env.list_templates() if "__pycache__" not in t]:
-            tmp = env.get_template(t)
-            outfile = root_dir.joinpath(t)
-            outfile.parent.mkdir(parents=True, exist_ok=True)
-            with open(outfile, "w") as fd:
-                fd.write(tmp.render(context))
-    except OSError as e:
-        logging.error("Cannot create workflow: %s", e)
-        exit(1)
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # Look up the Python version in the background while the templates are being loaded
+        system_python_version = executor.submit(_system_python_version)
+        try:
+            logging.debug("Copying template")
+            env = _template_environment()
+            templates = env.list_templates(filter_func=lambda t: "__pycache__" not in t)
+            # Shared by all render threads, so it's made read-only
+            context = MappingProxyType(
+                {
+                    "year": datetime.datetime.now().year,
+                    "system_python_version": system_python_version.result(),
+                    "name": name,
+                    "keyword": args.keyword,
+                    "bundle_id": args.bundle_id,
+                    "author": args.author or "",
+                    "website": args.website or "",
+                    "description": args.description or "",
+                }
+            )
+            logging.debug("Generating templates from %s to %s", templates, root_dir)
+            outfiles = {t: root_dir.joinpath(t) for t in templates}
+            for directory in sorted({outfile.parent for outfile in outfiles.values()}, key=lambda p: len(p.parts)):
+                directory.mkdir(parents=True, exist_ok=True)
+            # Templates are independent of each other, so they can be rendered concurrently
+            list(executor.map(lambda t: _render_template(env, t, outfiles[t], context), outfiles))
+        except OSError as e:
+            logging.error("Cannot create workflow: %s", e)
+            exit(1)
 
     wf_file_path = wf_dir.joinpath("workflow.py")
 
@@ -269,12 +409,12 @@ def new(args: argparse.Namespace):
 
     if args.git:
         logging.debug("Initialising git repository")
-        if subprocess.call(["git", "init", name]) != 0:
+        if subprocess.call([_git_executable(), "init", name]) != 0:
             logging.warning("Failed to create git repository. Ignoring.")
 
     logging.debug("Creating info.plist")
     with wf_dir.joinpath("info.plist").open(mode="xb") as f:
-        plistlib.dump(
+        _plist.dump(
             _make_plist(
                 name=name,
                 keyword=args.keyword,
@@ -285,6 +425,7 @@ def new(args: argparse.Namespace):
             ),
             f,
             sort_keys=True,
+            fmt=_plist.FMT_BINARY if args.binary_plist else _plist.FMT_XML,
         )
     if args.vendor:
         _vendor(root_dir, upgrade=False)
@@ -312,7 +453,7 @@ def link(args: argparse.Namespace):
         _link(
             relink=args.relink,
             same_path=args.same_path,
-            wf_dir=Path.cwd().joinpath("Workflow"),
+            wf_dir=_cwd().joinpath("Workflow"),
         )
     except ValueError as e:
         logging.error("Error creating link: %s", e)
@@ -383,39 +524,59 @@ def vendor(args: argparse.Namespace):
                             Whether to pass `--upgrade` to `pip install` when vendoring (default: False)
     ```
     """
-    _vendor(root_path=Path.cwd(), upgrade=args.upgrade)
+    _vendor(root_path=_cwd(), upgrade=args.upgrade)
 
 
 def _vendor(root_path: Path, upgrade: bool) -> bool:
     """
     Download dependencies from `requirements.txt`
 
+    Uses `uv` if it's installed and falls back to `pip` otherwise.
+
     :param root_path: The root path of the workflow project
-    :param upgrade: Whether to pass `--upgrade` to `pip install`
+    :param upgrade: Whether to pass `--upgrade` to the installer
     :return: whether the download was successful
     """
 
     vendored_path = root_path / "Workflow" / "vendored"
     vendored_path.mkdir(parents=True, exist_ok=True)
 
-    import subprocess
+    uv = shutil.which("uv")
+    if uv:
+        install_command = [uv, "pip", "install", f"--python={sys.executable}"]
+    else:
+        # The workflow runs from source, so compiling the vendored modules would be wasted work
+        install_command = [sys.executable, "-m", "pip", "install", "--no-compile"]
 
-    pip_command = [
-        sys.executable,
-        "-m",
-        "pip",
-        "install",
+    install_command += [
         "-r",
         f"{root_path}/requirements.txt",
         f"--target={vendored_path}",
     ]
 
     if upgrade:
-        pip_command.append("--upgrade")
+        install_command.append("--upgrade")
 
-    logging.debug("Running pip: python %s", " ".join(pip_command[1:]))
+    logging.debug("Installing dependencies: %s", " ".join(install_command))
 
-    return subprocess.call(pip_command) == 0
+    env = {**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1"}
+    return subprocess.call(install_command, env=env) == 0
+
+
+def _run_git(*argv: str) -> int:
+    """
+    Run a git command, logging its error output if it fails
+
+    :param argv: The arguments to pass to git
+    :return: the exit code of the command
+    """
+    result = subprocess.run(
+        [_git_executable(), *argv], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False
+    )
+    if result.returncode != 0 and result.stderr:
+        logging.error(result.stderr.strip())
+
+    return result.returncode
 
 
 @_ensure_no_local_changes
@@ -424,33 +585,30 @@ def release(args: argparse.Namespace):
     # Update version number in info.plist
     plist_path = _info_plist_path()
     with plist_path.open("rb") as f:
-        pl = plistlib.load(f)
+        fmt = _plist.detect_format(f)
+        pl = _plist.load(f)
 
     pl["version"] = args.version
     with plist_path.open(mode="wb") as f:
-        plistlib.dump(
+        _plist.dump(
             pl,
             f,
             sort_keys=True,
+            fmt=fmt,
         )
 
-    # commit changes to git
-    commit_command = ["git", "commit", "-a", "-m", f"release {args.version}"]
-    if subprocess.call(commit_command) != 0:
-        logging.error("Error committing changes")
-        exit(1)
-
-    # create annotated tag with version
-    tag_command = ["git", "tag", "-a", args.version, "-m", args.version]
-    if subprocess.call(tag_command) != 0:
-        logging.error("Error tagging changes")
-        exit(1)
-
-    # push changes & tag
-    push_command = ["git", "push", "origin", "--follow-tags"]
-    if subprocess.call(push_command) != 0:
-        logging.error("Error pushing changes")
-        exit(1)
+    git_steps = [
+        # commit changes to git
+        (("commit", "-a", "-m", f"release {args.version}"), "Error committing changes"),
+        # create annotated tag with version
+        (("tag", "-a", args.version, "-m", args.version), "Error tagging changes"),
+        # push changes & tag
+        (("push", "origin", "--follow-tags"), "Error pushing changes"),
+    ]
+    for git_args, error in git_steps:
+        if _run_git(*git_args) != 0:
+            logging.error(error)
+            exit(1)
 
 
 @_must_be_run_from_workflow_project_root
@@ -462,14 +620,16 @@ def package(args: argparse.Namespace):
     Users can import the package by double-clicking the file.
 
     ```
-    usage: pyfred package [-h] --name NAME
+    usage: pyfred package [-h] --name NAME [--compress-level LEVEL]
 
     options:
-      -h, --help   show this help message and exit
-      --name NAME  The name of the workflow file
+      -h, --help            show this help message and exit
+      --name NAME           The name of the workflow file
+      --compress-level LEVEL
+                            The DEFLATE compression level, from 0 (none) to 9 (best)
     ```
     """
-    root_dir = Path.cwd()
+    root_dir = _cwd()
 
     has_requirements = root_dir.joinpath("requirements.txt").exists()
     logging.debug("requirements.txt exists %s", has_requirements)
@@ -481,13 +641,13 @@ def package(args: argparse.Namespace):
     output = root_dir / "dist"
     output.mkdir(exist_ok=True)
 
-    _zip_dir(root_dir / "Workflow", output / f"{args.name}.alfredworkflow")
+    _zip_dir(root_dir / "Workflow", output / f"{args.name}.alfredworkflow", compress_level=args.compress_level)
 
 
 @_must_be_run_from_workflow_project_root
 def version(args: argparse.Namespace) -> None:
     with _info_plist_path().open("rb") as f:
-        pl = plistlib.load(f)
+        pl = _plist.load(f)
 
     print(pl["version"])
 
@@ -495,7 +655,7 @@ def version(args: argparse.Namespace) -> None:
 @_must_be_run_from_workflow_project_root
 def name(args: argparse.Namespace) -> None:
     with _info_plist_path().open("rb") as f:
-        pl = plistlib.load(f)
+        pl = _plist.load(f)
 
     print(pl["name"])
 
@@ -512,7 +672,7 @@ def show_link(args: argparse.Namespace) -> None:
       -h, --help  show this help message and exit
     ```
     """
-    wf_dir = Path.cwd().joinpath("Workflow")
+    wf_dir = _cwd().joinpath("Workflow")
     link_path = find_workflow_link(wf_dir)
 
     if link_path:
@@ -522,6 +682,21 @@ def show_link(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
+def _version_str(arg_value: str) -> str:
+    """
+    Validate a version argument
+
+    :param arg_value: The version passed on the command line
+    :return: the version if it is of the form `MAJOR.MINOR.PATCH` without leading zeros
+    """
+    parts = arg_value.split(".")
+    if len(parts) != 3 or not all(
+        p.isascii() and p.isdigit() and len(p) <= 9 and (p == "0" or not p.startswith("0")) for p in parts
+    ):
+        raise argparse.ArgumentTypeError("invalid version string")
+    return arg_value
+
+
 def _cli():
     """
     The entry point for the CLI.
@@ -556,74 +731,94 @@ def _cli():
     )
     subparsers = parser.add_subparsers(required=True)
 
+    # Only the arguments of the invoked command are parsed, so the other commands' arguments aren't registered
+    command = next((arg for arg in sys.argv[1:] if not arg.startswith("-")), None)
+
     new_parser = subparsers.add_parser("new", help="Create a new workflow")
-    new_parser.add_argument("name", type=str, help="Name of the new workflow")
-    new_parser.add_argument(
-        "-k",
-        "--keyword",
-        type=str,
-        required=True,
-        help="The keyword to trigger the workflow",
-    )
-    new_parser.add_argument(
-        "-b",
-        "--bundle-id",
-        type=str,
-        required=True,
-        help="The bundle identifier, usually in reverse DNS notation",
-    )
-    new_parser.add_argument("--author", type=str, required=True, help="Name of the author")
-    new_parser.add_argument("--website", type=str, help="The workflow website")
-    new_parser.add_argument("--description", type=str, help="A description for the workflow")
-    new_parser.add_argument(
-        "--git",
-        action=argparse.BooleanOptionalAction,
-        default=True,
-        help="Whether to create a git repository",
-    )
-    new_parser.add_argument(
-        "--link", action=argparse.BooleanOptionalAction, default=True, help="Create a symbolic link to this workflow"
-    )
-    new_parser.add_argument(
-        "--vendor", action=argparse.BooleanOptionalAction, default=True, help="Install workflow dependencies"
-    )
+    if command == "new":
+        new_parser.add_argument("name", type=str, help="Name of the new workflow")
+        new_parser.add_argument(
+            "-k",
+            "--keyword",
+            type=str,
+            required=True,
+            help="The keyword to trigger the workflow",
+        )
+        new_parser.add_argument(
+            "-b",
+            "--bundle-id",
+            type=str,
+            required=True,
+            help="The bundle identifier, usually in reverse DNS notation",
+        )
+        new_parser.add_argument("--author", type=str, required=True, help="Name of the author")
+        new_parser.add_argument("--website", type=str, help="The workflow website")
+        new_parser.add_argument("--description", type=str, help="A description for the workflow")
+        new_parser.add_argument(
+            "--git",
+            action=argparse.BooleanOptionalAction,
+            default=True,
+            help="Whether to create a git repository",
+        )
+        new_parser.add_argument(
+            "--link",
+            action=argparse.BooleanOptionalAction,
+            default=True,
+            help="Create a symbolic link to this workflow",
+        )
+        new_parser.add_argument(
+            "--vendor", action=argparse.BooleanOptionalAction, default=True, help="Install workflow dependencies"
+        )
+        new_parser.add_argument(
+            "--binary-plist",
+            action=argparse.BooleanOptionalAction,
+            default=False,
+            help="Write info.plist in the binary format instead of XML",
+        )
     new_parser.set_defaults(func=new)
 
     vendor_parser = subparsers.add_parser("vendor", help="Install workflow dependencies")
-    vendor_parser.add_argument(
-        "--upgrade",
-        action=argparse.BooleanOptionalAction,
-        default=False,
-        help="Whether to pass `--upgrade` to `pip install` when vendoring",
-    )
+    if command == "vendor":
+        vendor_parser.add_argument(
+            "--upgrade",
+            action=argparse.BooleanOptionalAction,
+            default=False,
+            help="Whether to pass `--upgrade` to `pip install` when vendoring",
+        )
     vendor_parser.set_defaults(func=vendor)
 
     link_parser = subparsers.add_parser("link", help="Create a symbolic link to this workflow in Alfred")
-    link_parser.add_argument(
-        "--relink",
-        action=argparse.BooleanOptionalAction,
-        default=False,
-        help="Whether to delete (if exists) and recreate the link",
-    )
-    link_parser.add_argument(
-        "--same-path",
-        action=argparse.BooleanOptionalAction,
-        default=False,
-        help="Whether to reuse (if exists) the previous path for the link",
-    )
+    if command == "link":
+        link_parser.add_argument(
+            "--relink",
+            action=argparse.BooleanOptionalAction,
+            default=False,
+            help="Whether to delete (if exists) and recreate the link",
+        )
+        link_parser.add_argument(
+            "--same-path",
+            action=argparse.BooleanOptionalAction,
+            default=False,
+            help="Whether to reuse (if exists) the previous path for the link",
+        )
     link_parser.set_defaults(func=link)
 
-    def version_str(arg_value: str, pat=re.compile(r"^[0-9]+\.[0-9]+\.[0-9]+$")) -> str:
-        if not pat.match(arg_value):
-            raise argparse.ArgumentTypeError("invalid version string")
-        return arg_value
-
     release_parser = subparsers.add_parser("release", help="Update version & tag for release build")
-    release_parser.add_argument("--version", type=version_str, required=True, help="Version to update")
+    if command == "release":
+        release_parser.add_argument("--version", type=_version_str, required=True, help="Version to update")
     release_parser.set_defaults(func=release)
 
     package_parser = subparsers.add_parser("package", help="Package the workflow for distribution")
-    package_parser.add_argument("--name", type=str, required=True, help="The name of the workflow file")
+    if command == "package":
+        package_parser.add_argument("--name", type=str, required=True, help="The name of the workflow file")
+        package_parser.add_argument(
+            "--compress-level",
+            type=int,
+            choices=range(10),
+            default=6,
+            metavar="LEVEL",
+            help="The DEFLATE compression level, from 0 (none) to 9 (best)",
+        )
     package_parser.set_defaults(func=package)
 
     version_parser = subparsers.add_parser("version", help="Display the version of the workflow")
@@ -4,7 +4,11 @@ import plistlib
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Union, cast
+from typing import Any, Callable, Optional, Union, cast
+
+
+def _without_none(d: dict) -> dict:
+    return {k: v for k, v in d.items() if v is not None}
 
 
 class Key(Enum):
@@ -89,6 +93,14 @@ class Icon:
         if self.type and self.type not in ("fileicon", "filetype"):
             raise ValueError("if set, type must be either fileicon or filetype")
 
+    def to_dict(self) -> dict:
+        """
+        Get the JSON-serialisable representation expected by Alfred
+
+        :return: a dictionary with the fields that are set
+        """
+        return _without_none({"path": self.path, "type": self.type})
+
 
 class Type(Enum):
     """
@@ -122,6 +134,14 @@ class Text:
         if self.copy is None and self.large_type is None:
             raise ValueError("At least one of copy or large_type must be set")
 
+    def to_dict(self) -> dict:
+        """
+        Get the JSON-serialisable representation expected by Alfred
+
+        :return: a dictionary with the fields that are set
+        """
+        return _without_none({"copy": self.copy, "large_type": self.large_type})
+
 
 @dataclass(frozen=True)
 class Data:
@@ -136,6 +156,21 @@ class Data:
     valid: Optional[bool] = None
     """Whether the item is selectable"""
 
+    def to_dict(self) -> dict:
+        """
+        Get the JSON-serialisable representation expected by Alfred
+
+        :return: a dictionary with the fields that are set
+        """
+        return _without_none(
+            {
+                "subtitle": self.subtitle,
+                "arg": self.arg,
+                "icon": self.icon.to_dict() if self.icon else None,
+                "valid": self.valid,
+            }
+        )
+
 
 @dataclass(frozen=True)
 class Action:
@@ -157,6 +192,14 @@ class Action:
     auto: Optional[Union[str, list[str]]]
     """The value to be passed to Universal actions for it to autodetect the type"""
 
+    def to_dict(self) -> dict:
+        """
+        Get the JSON-serialisable representation expected by Alfred
+
+        :return: a dictionary with the fields that are set
+        """
+        return _without_none({"text": self.text, "url": self.url, "file": self.file, "auto": self.auto})
+
 
 @dataclass(frozen=True)
 class OutputItem:
@@ -215,6 +258,30 @@ class OutputItem:
         if not self.title:
             raise ValueError("title must be set")
 
+    def to_dict(self) -> dict:
+        """
+        Get the JSON-serialisable representation expected by Alfred
+
+        :return: a dictionary with the fields that are set
+        """
+        return _without_none(
+            {
+                "title": self.title,
+                "subtitle": self.subtitle,
+                "uid": self.uid,
+                "arg": self.arg,
+                "icon": self.icon.to_dict() if self.icon else None,
+                "valid": self.valid,
+                "match": self.match,
+                "autocomplete": self.autocomplete,
+                "mods": {k: v.to_dict() for k, v in self.mods.items()} if self.mods is not None else None,
+                "text": self.text.to_dict() if self.text else None,
+                "quicklookurl": self.quicklookurl,
+                "action": self.action.to_dict() if isinstance(self.action, Action) else self.action,
+                "type": self.type,
+            }
+        )
+
 
 @dataclass(frozen=True)
 class CacheConfig:
@@ -232,6 +299,14 @@ class CacheConfig:
         if self.seconds is not None and not 5 <= self.seconds <= 84600:
             raise ValueError("seconds must be between 5 and 86400")
 
+    def to_dict(self) -> dict:
+        """
+        Get the JSON-serialisable representation expected by Alfred
+
+        :return: a dictionary with the fields that are set
+        """
+        return _without_none({"seconds": self.seconds, "loosereload": self.loosereload})
+
 
 @dataclass(frozen=True)
 class ScriptFilterOutput:
@@ -256,6 +331,60 @@ class ScriptFilterOutput:
         if self.rerun is not None and not 0.1 <= self.rerun <= 5:
             raise ValueError("rerun must be between 0.1 and 5")
 
+    def to_dict(self) -> dict:
+        """
+        Get the JSON-serialisable representation expected by Alfred
+
+        :return: a dictionary with the fields that are set
+        """
+        return _without_none(
+            {
+                "rerun": self.rerun,
+                "items": [item.to_dict() for item in self.items] if self.items is not None else None,
+                "variables": self.variables,
+                "cache": self.cache.to_dict() if self.cache else None,
+                "skipknowledge": self.skipknowledge,
+            }
+        )
+
+
+def _as_str(value: Optional[str]) -> Optional[str]:
+    return value
+
+
+def _as_bool(value: Optional[str]) -> bool:
+    return value == "1"
+
+
+def _as_path(value: Optional[str]) -> Path:
+    return Path(cast(str, value))
+
+
+def _as_optional_path(value: Optional[str]) -> Optional[Path]:
+    return Path(value).expanduser() if value else None
+
+
+# The `Environment` fields with the environment variables they're read from and the functions to convert the values
+_ENVIRONMENT_SCHEMA: tuple[tuple[str, str, Callable[[Optional[str]], Any]], ...] = (
+    ("debug", "alfred_debug", _as_bool),
+    ("preferences_file", "alfred_preferences", _as_path),
+    ("preferences_localhash", "alfred_preferences_localhash", _as_str),
+    ("theme", "alfred_theme", _as_str),
+    ("theme_background", "alfred_theme_background", _as_str),
+    ("theme_selection_background", "alfred_theme_selection_background", _as_str),
+    ("theme_subtext", "alfred_theme_subtext", _as_str),
+    ("version", "alfred_version", _as_str),
+    ("version_build", "alfred_version_build", _as_str),
+    ("workflow_name", "alfred_workflow_name", _as_str),
+    ("workflow_version", "alfred_workflow_version", _as_str),
+    ("workflow_bundleid", "alfred_workflow_bundleid", _as_str),
+    ("workflow_uid", "alfred_workflow_uid", lambda value: value or ""),
+    ("workflow_cache", "alfred_workflow_cache", _as_optional_path),
+    ("workflow_data", "alfred_workflow_data", _as_optional_path),
+    ("workflow_description", "alfred_workflow_description", _as_str),
+    ("workflow_keyword", "alfred_workflow_keyword", _as_str),
+)
+
 
 @dataclass(frozen=True)
 class Environment:
@@ -311,33 +440,12 @@ class Environment:
         :return: a model populated from the environment variables set by Alfred
         """
 
-        if not os.environ.get("alfred_version"):
+        environ = os.environ
+        if not environ.get("alfred_version"):
             logging.warning("Not running in an Alfred environment")
             return None
 
-        cache_dir = os.environ.get("alfred_workflow_cache")
-        data_dir = os.environ.get("alfred_workflow_data")
-        cast(str, os.environ.get("alfred_preferences"))
-
-        return Environment(
-            debug=(os.environ.get("alfred_debug") == "1"),
-            preferences_file=Path(cast(str, os.environ.get("alfred_preferences"))),
-            preferences_localhash=cast(str, os.environ.get("alfred_preferences_localhash")),
-            theme=cast(str, os.environ.get("alfred_theme")),
-            theme_background=cast(str, os.environ.get("alfred_theme_background")),
-            theme_selection_background=cast(str, os.environ.get("alfred_theme_selection_background")),
-            theme_subtext=cast(str, os.environ.get("alfred_theme_subtext")),
-            version=cast(str, os.environ.get("alfred_version")),
-            version_build=cast(str, os.environ.get("alfred_version_build")),
-            workflow_name=cast(str, os.environ.get("alfred_workflow_name")),
-            workflow_version=os.environ.get("alfred_workflow_version"),
-            workflow_bundleid=os.environ.get("alfred_workflow_bundleid"),
-            workflow_uid=os.environ.get("alfred_workflow_uid") or "",
-            workflow_cache=Path(cache_dir).expanduser() if cache_dir else None,
-            workflow_data=Path(data_dir).expanduser() if data_dir else None,
-            workflow_description=cast(str, os.environ.get("alfred_workflow_description")),
-            workflow_keyword=cast(str, os.environ.get("alfred_workflow_keyword")),
-        )
+        return Environment(**{field: convert(environ.get(key)) for field, key, convert in _ENVIRONMENT_SCHEMA})
 
     @property
     def preferences(self) -> dict:
@@ -1,22 +1,45 @@
 import argparse
 import json
+import plistlib
+import subprocess
 import sys
 from pathlib import Path
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import ANY, MagicMock, call, patch
+from zipfile import ZipFile
 
 import pytest
 
 from pyfred.cli import (
+    _cli,
+    _cwd,
+    _ensure_no_local_changes,
+    _get_sync_directory,
     _get_workflows_directory,
+    _git_executable,
+    _home,
+    _vendor,
+    _version_str,
+    _zip_dir,
+    find_workflow_link,
     link,
     new,
     package,
+    release,
     show_link,
     vendor,
 )
 from pyfred.model import Data, Icon, Key, OutputItem, ScriptFilterOutput, Text, Type
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    for cached in (_cwd, _home, _get_sync_directory, _get_workflows_directory, _git_executable):
+        cached.cache_clear()
+    yield
+    for cached in (_cwd, _home, _get_sync_directory, _get_workflows_directory, _git_executable):
+        cached.cache_clear()
+
+
 def test_new(tmpdir):
     tmpdir = Path(tmpdir)
     sync_dir = tmpdir / "sync"
@@ -30,6 +53,7 @@ def test_new(tmpdir):
         author=None,
         website=None,
         description=None,
+        binary_plist=True,
     )
     args.name = "test_wf"
 
@@ -40,26 +64,52 @@ def test_new(tmpdir):
             "-m",
             "pip",
             "install",
+            "--no-compile",
             "-r",
             f"{tmpdir/'test_wf'/'requirements.txt'}",
             f"--target={tmpdir/'test_wf'/'Workflow'/'vendored'}",
-        ]
+        ],
+        env=ANY,
     )
 
     with patch("pathlib.Path.cwd", return_value=tmpdir):
         with patch("pyfred.cli._get_sync_directory", return_value=sync_dir):
-            with patch("subprocess.call", return_value=0) as mock_sub:
-                new(args)
-                assert mock_sub.call_count == 2
-                mock_sub.assert_has_calls([expected_git_call, expected_vendor_call])
+            with patch("shutil.which", return_value=None):
+                with patch("subprocess.call", return_value=0) as mock_sub:
+                    new(args)
+                    assert mock_sub.call_count == 2
+                    mock_sub.assert_has_calls([expected_git_call, expected_vendor_call])
 
     assert (tmpdir / "test_wf/Workflow/workflow.py").exists()
+    assert (tmpdir / "test_wf/Workflow/info.plist").read_bytes().startswith(b"bplist00")
     installed_workflows = list(workflows.iterdir())
     assert len(installed_workflows) == 1
     assert installed_workflows[0].is_symlink()
     assert installed_workflows[0].readlink() == tmpdir / "test_wf" / "Workflow"
 
 
+def test_vendor_with_uv(tmpdir):
+    tmpdir = Path(tmpdir)
+
+    with patch("shutil.which", return_value="/opt/bin/uv"):
+        with patch("subprocess.call", return_value=0) as mock_sub:
+            assert _vendor(tmpdir, upgrade=True)
+
+    mock_sub.assert_called_once_with(
+        [
+            "/opt/bin/uv",
+            "pip",
+            "install",
+            f"--python={sys.executable}",
+            "-r",
+            f"{tmpdir}/requirements.txt",
+            f"--target={tmpdir/'Workflow'/'vendored'}",
+            "--upgrade",
+        ],
+        env=ANY,
+    )
+
+
 def test_get_workflows_directory():
     expected = Path.home() / "Library/Application Support/Alfred/Alfred.alfredpreferences/workflows"
 
@@ -67,6 +117,31 @@ def test_get_workflows_directory():
         assert _get_workflows_directory() == expected
 
 
+def test_find_workflow_link(tmpdir):
+    tmpdir = Path(tmpdir)
+    workflows = tmpdir / "workflows"
+    workflows.mkdir()
+    wf_dir = tmpdir / "test_wf" / "Workflow"
+    wf_dir.mkdir(parents=True)
+    other_dir = tmpdir / "other_wf" / "Workflow"
+    other_dir.mkdir(parents=True)
+
+    (workflows / "user.workflow.A").mkdir()
+    (workflows / "user.workflow.B").symlink_to(other_dir)
+    (workflows / "user.workflow.C").symlink_to(wf_dir)
+
+    with patch("pyfred.cli._get_workflows_directory", return_value=workflows):
+        assert find_workflow_link(wf_dir) == workflows / "user.workflow.C"
+        assert find_workflow_link(other_dir) == workflows / "user.workflow.B"
+        assert find_workflow_link(tmpdir / "missing") is None
+
+    # Relative links are resolved against the workflows directory
+    (workflows / "user.workflow.B").unlink()
+    (workflows / "user.workflow.D").symlink_to(Path("..") / "other_wf" / "Workflow")
+    with patch("pyfred.cli._get_workflows_directory", return_value=workflows):
+        assert find_workflow_link(other_dir) == workflows / "user.workflow.D"
+
+
 def test_full_model_serialises_to_json():
     output = ScriptFilterOutput(
         rerun=4.2,
@@ -105,14 +180,14 @@ def test_show_link_with_link(tmpdir):
     wf_dir.mkdir(parents=True)
     link_path = Path("/path/to/workflow/link")
 
+    (wf_dir / "info.plist").touch()
+
     with patch("pathlib.Path.cwd", return_value=tmpdir):
-        with patch("pyfred.cli._info_plist_path") as mock_info_plist_path:
-            mock_info_plist_path.return_value.exists.return_value = True
-            with patch("pyfred.cli.find_workflow_link", return_value=link_path) as mock_find:
-                with patch("builtins.print") as mock_print:
-                    show_link(MagicMock(spec=argparse.Namespace))
-                    mock_find.assert_called_once_with(wf_dir)
-                    mock_print.assert_called_once_with(link_path)
+        with patch("pyfred.cli.find_workflow_link", return_value=link_path) as mock_find:
+            with patch("builtins.print") as mock_print:
+                show_link(MagicMock(spec=argparse.Namespace))
+                mock_find.assert_called_once_with(wf_dir)
+                mock_print.assert_called_once_with(link_path)
 
 
 def test_show_link_without_link(tmpdir):
@@ -120,16 +195,16 @@ def test_show_link_without_link(tmpdir):
     wf_dir = tmpdir / "Workflow"
     wf_dir.mkdir(parents=True)
 
+    (wf_dir / "info.plist").touch()
+
     with patch("pathlib.Path.cwd", return_value=tmpdir):
-        with patch("pyfred.cli._info_plist_path") as mock_info_plist_path:
-            mock_info_plist_path.return_value.exists.return_value = True
-            with patch("pyfred.cli.find_workflow_link", return_value=None) as mock_find:
-                with patch("logging.error") as mock_error:
-                    with pytest.raises(SystemExit) as excinfo:
-                        show_link(MagicMock(spec=argparse.Namespace))
-                    assert excinfo.value.code == 1
-                    mock_find.assert_called_once_with(wf_dir)
-                    mock_error.assert_called_once_with("No workflow link found. Use 'pyfred link' to create one.")
+        with patch("pyfred.cli.find_workflow_link", return_value=None) as mock_find:
+            with patch("logging.error") as mock_error:
+                with pytest.raises(SystemExit) as excinfo:
+                    show_link(MagicMock(spec=argparse.Namespace))
+                assert excinfo.value.code == 1
+                mock_find.assert_called_once_with(wf_dir)
+                mock_error.assert_called_once_with("No workflow link found. Use 'pyfred link' to create one.")
 
 
 def test_exits_if_not_in_workflow_dir(tmpdir):
@@ -138,3 +213,99 @@ def test_exits_if_not_in_workflow_dir(tmpdir):
             with pytest.raises(SystemExit) as excinfo:
                 func(MagicMock(spec=argparse.Namespace))
             assert excinfo.value.code == 1
+
+
+def test_zip_dir(tmpdir):
+    tmpdir = Path(tmpdir)
+    wf_dir = tmpdir / "Workflow"
+    (wf_dir / "vendored" / "pkg").mkdir(parents=True)
+    (wf_dir / "workflow.py").write_text("print('hi')")
+    (wf_dir / "workflow.py").chmod(0o755)
+    (wf_dir / "large.bin").write_bytes(b"x" * ((1 << 20) + 1))
+    (wf_dir / "vendored" / "pkg" / "__init__.py").write_text("")
+    (wf_dir / "link.py").symlink_to(wf_dir / "workflow.py")
+    output = tmpdir / "test.alfredworkflow"
+
+    _zip_dir(wf_dir, output)
+
+    with ZipFile(output) as zip_file:
+        assert sorted(zip_file.namelist()) == ["large.bin", "link.py", "vendored/pkg/__init__.py", "workflow.py"]
+        assert zip_file.read("workflow.py") == b"print('hi')"
+        assert zip_file.read("link.py") == b"print('hi')"
+        assert zip_file.getinfo("workflow.py").external_attr >> 16 & 0o777 == 0o755
+        assert zip_file.read("large.bin") == b"x" * ((1 << 20) + 1)
+
+
+def test_ensure_no_local_changes(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    subprocess.check_call(["git", "init", "-q"])
+    fn = MagicMock()
+    guarded = _ensure_no_local_changes(fn)
+
+    guarded(MagicMock(spec=argparse.Namespace))
+    fn.assert_called_once()
+
+    Path(tmpdir, "changed.txt").write_text("change")
+    with pytest.raises(SystemExit) as excinfo:
+        guarded(MagicMock(spec=argparse.Namespace))
+    assert excinfo.value.code == 1
+    fn.assert_called_once()
+
+
+def test_release(tmpdir):
+    tmpdir = Path(tmpdir)
+    wf_dir = tmpdir / "Workflow"
+    wf_dir.mkdir()
+    with (wf_dir / "info.plist").open("wb") as f:
+        plistlib.dump({"name": "test", "version": "0.0.0"}, f)
+
+    with patch("pathlib.Path.cwd", return_value=tmpdir):
+        with patch("pyfred.cli._has_local_changes", return_value=False), patch("shutil.which", return_value=None):
+            with patch("subprocess.run", return_value=subprocess.CompletedProcess([], 0)) as mock_run:
+                release(argparse.Namespace(version="1.2.3"))
+
+    assert [c.args[0] for c in mock_run.call_args_list] == [
+        ["git", "commit", "-a", "-m", "release 1.2.3"],
+        ["git", "tag", "-a", "1.2.3", "-m", "1.2.3"],
+        ["git", "push", "origin", "--follow-tags"],
+    ]
+    with (wf_dir / "info.plist").open("rb") as f:
+        assert plistlib.load(f) == {"name": "test", "version": "1.2.3"}
+
+
+@pytest.mark.parametrize("version", ["0.0.0", "1.2.3", "10.20.300"])
+def test_version_str_valid(version):
+    assert _version_str(version) == version
+
+
+@pytest.mark.parametrize(
+    "version", ["", "1.2", "1.2.3.4", "01.2.3", "1.2.x", "1..3", "1.2.-3", "1.2.\u0663", "1.2.1234567890"]
+)
+def test_version_str_invalid(version):
+    with pytest.raises(argparse.ArgumentTypeError):
+        _version_str(version)
+
+
+def test_cli_registers_arguments_of_invoked_command():
+    with patch("sys.argv", ["pyfred", "--debug", "package", "--name", "test", "--compress-level", "1"]):
+        with patch("pyfred.cli.package") as mock_package:
+            _cli()
+
+    args = mock_package.call_args.args[0]
+    assert (args.debug, args.name, args.compress_level) == (True, "test", 1)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["pyfred", "release", "--version", "1.2"],
+        ["pyfred", "package"],
+        ["pyfred", "unknown"],
+        ["pyfred"],
+    ],
+)
+def test_cli_rejects_invalid_arguments(argv):
+    with patch("sys.argv", argv):
+        with pytest.raises(SystemExit) as excinfo:
+            _cli()
+    assert excinfo.value.code == 2
@@ -1,6 +1,18 @@
+import json
+
 import pytest
 
-from pyfred.model import Icon, OutputItem, ScriptFilterOutput
+from pyfred.model import (
+    Action,
+    CacheConfig,
+    Data,
+    Icon,
+    Key,
+    OutputItem,
+    ScriptFilterOutput,
+    Text,
+    Type,
+)
 
 
 def test_model_validation():
@@ -12,3 +24,36 @@ def test_model_validation():
 
     with pytest.raises(ValueError):
         Icon(type="invalid", path="public.jpeg")
+
+
+def test_to_dict_omits_unset_fields():
+    output = ScriptFilterOutput(
+        rerun=4.2,
+        items=[
+            OutputItem(
+                title="Hello Alfred!",
+                subtitle="a string",
+                icon=Icon.uti("public.jpeg"),
+                valid=True,
+                mods={
+                    Key.Cmd: Data(subtitle="My new subtitle", icon=Icon.file_icon("/System/Applications/Calendar.app"))
+                },
+                text=Text(large_type="Large type this"),
+                action=Action(text="text", url=None, file=None, auto=["a", "b"]),
+                type=Type.File,
+            ),
+            OutputItem(title="A minimal item", action="https://example.com"),
+        ],
+        variables={"key": 42},
+        cache=CacheConfig(seconds=10),
+    )
+
+    def vars_if_set(obj):
+        return {k: v for k, v in vars(obj).items() if v is not None}
+
+    assert output.to_dict() == json.loads(json.dumps(output, default=vars_if_set))
+    assert output.to_dict()["items"][1] == {
+        "title": "A minimal item",
+        "action": "https://example.com",
+        "type": "default",
+    }
@@ -0,0 +1,47 @@
+import datetime
+import io
+import plistlib
+
+import pytest
+
+from pyfred import _plist
+
+PLIST = {
+    "name": "test",
+    "description": "",
+    "version": "0.0.0",
+    "withspace": True,
+    "queuedelayimmediatelyinitially": False,
+    "argumenttype": 1,
+    "rerun": 0.5,
+    "created": datetime.datetime(2022, 10, 16, 12, 30, 0),
+    "icon": b"\x00\x01binary",
+    "uidata": [],
+    "variables": {"PYTHONPATH": ".:vendored"},
+    "objects": [{"uid": "abc", "config": {"keyword": "hi", "type": 8}}, "a string"],
+}
+
+
+@pytest.mark.parametrize("fmt", [_plist.FMT_XML, _plist.FMT_BINARY])
+def test_round_trip_matches_plistlib_bytes(fmt):
+    original = plistlib.dumps(PLIST, fmt=fmt, sort_keys=True)
+    value = _plist.load(io.BytesIO(original))
+    buffer = io.BytesIO()
+    _plist.dump(value, buffer, fmt=fmt)
+
+    assert buffer.getvalue() == original
+
+
+@pytest.mark.parametrize("fmt", [plistlib.FMT_XML, plistlib.FMT_BINARY])
+def test_load_reads_plistlib_output(fmt):
+    assert _plist.load(io.BytesIO(plistlib.dumps(PLIST, fmt=fmt))) == PLIST
+
+
+@pytest.mark.parametrize("fmt", [_plist.FMT_XML, _plist.FMT_BINARY])
+def test_detect_format(fmt):
+    buffer = io.BytesIO()
+    _plist.dump(PLIST, buffer, fmt=fmt)
+    buffer.seek(0)
+
+    assert _plist.detect_format(buffer) == fmt
+    assert _plist.load(buffer) == PLIST
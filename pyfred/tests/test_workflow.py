@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import PosixPath
 
 import pytest
@@ -6,101 +7,205 @@ import pytest
 from pyfred.model import CacheConfig, Environment, OutputItem, ScriptFilterOutput
 from pyfred.workflow import external_script, script_filter
 
-
-@pytest.fixture(autouse=True)
-def alfred_environment(monkeypatch):
-    monkeypatch.setenv("alfred_preferences", "/Users/Crayons/Dropbox/Alfred/Alfred.alfredpreferences")
-    monkeypatch.setenv("alfred_preferences", "/Users/Crayons/Dropbox/Alfred/Alfred.alfredpreferences")
-    monkeypatch.setenv("alfred_preferences_localhash", "adbd4f66bc3ae8493832af61a41ee609b20d8705")
-    monkeypatch.setenv("alfred_theme", "alfred.theme.yosemite")
-    monkeypatch.setenv("alfred_theme_background", "rgba(255,255,255,0.98)")
-    monkeypatch.setenv("alfred_theme_selection_background", "rgba(0,0,0,0.98)")
-    monkeypatch.setenv("alfred_theme_subtext", "3")
-    monkeypatch.setenv("alfred_version", "5.5")
-    monkeypatch.setenv("alfred_version_build", "2058")
-    monkeypatch.setenv("alfred_workflow_bundleid", "com.alfredapp.googlesuggest")
-    monkeypatch.setenv(
-        "alfred_workflow_cache",
-        "/Users/Crayons/Library/Caches/com.runningwithcrayons.Alfred/Workflow Data/com.alfredapp.googlesuggest",
-    )
-    monkeypatch.setenv(
-        "alfred_workflow_data",
-        "/Users/Crayons/Library/Application Support/Alfred/Workflow Data/com.alfredapp.googlesuggest",
-    )
-    monkeypatch.setenv("alfred_workflow_name", "Google Suggest")
-    monkeypatch.setenv("alfred_workflow_version", "1.7")
-    monkeypatch.setenv("alfred_workflow_uid", "user.workflow.B0AC54EC-601C-479A-9428-01F9FD732959")
-    monkeypatch.setenv("alfred_debug", "1")
-    monkeypatch.setenv("alfred_workflow_description", "A workflow description")
-    monkeypatch.setenv("alfred_workflow_keyword", "goog")
+_PREF_PATH = PosixPath("/Users/Crayons/Dropbox/Alfred/Alfred.alfredpreferences")
+_CACHE_PATH = PosixPath(
+    "/Users/Crayons/Library/Caches/com.runningwithcrayons.Alfred/Workflow Data/com.alfredapp.googlesuggest"
+)
+_DATA_PATH = PosixPath("/Users/Crayons/Library/Application Support/Alfred/Workflow Data/com.alfredapp.googlesuggest")
+
+ALFRED_VARS: dict[str, str] = {
+    "alfred_preferences": str(_PREF_PATH),
+    "alfred_preferences_localhash": "adbd4f66bc3ae8493832af61a41ee609b20d8705",
+    "alfred_theme": "alfred.theme.yosemite",
+    "alfred_theme_background": "rgba(255,255,255,0.98)",
+    "alfred_theme_selection_background": "rgba(0,0,0,0.98)",
+    "alfred_theme_subtext": "3",
+    "alfred_version": "5.5",
+    "alfred_version_build": "2058",
+    "alfred_workflow_bundleid": "com.alfredapp.googlesuggest",
+    "alfred_workflow_cache": str(_CACHE_PATH),
+    "alfred_workflow_data": str(_DATA_PATH),
+    "alfred_workflow_name": "Google Suggest",
+    "alfred_workflow_version": "1.7",
+    "alfred_workflow_uid": "user.workflow.B0AC54EC-601C-479A-9428-01F9FD732959",
+    "alfred_debug": "1",
+    "alfred_workflow_description": "A workflow description",
+    "alfred_workflow_keyword": "goog",
+}
+
+
+@pytest.fixture(autouse=True, scope="module")
+def alfred_environment():
+    saved = {k: os.environ.get(k) for k in ALFRED_VARS}
+    os.environ.update(ALFRED_VARS)
+    try:
+        yield
+    finally:
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+_EXPECTED_ENV = Environment(
+    debug=True,
+    preferences_file=_PREF_PATH,
+    preferences_localhash="adbd4f66bc3ae8493832af61a41ee609b20d8705",
+    version="5.5",
+    version_build="2058",
+    workflow_name="Google Suggest",
+    workflow_version="1.7",
+    workflow_bundleid="com.alfredapp.googlesuggest",
+    workflow_uid="user.workflow.B0AC54EC-601C-479A-9428-01F9FD732959",
+    workflow_cache=_CACHE_PATH,
+    workflow_data=_DATA_PATH,
+    theme="alfred.theme.yosemite",
+    theme_background="rgba(255,255,255,0.98)",
+    theme_selection_background="rgba(0,0,0,0.98)",
+    theme_subtext="3",
+    workflow_description="A workflow description",
+    workflow_keyword="goog",
+)
 
 
 def _assert_env(env: Environment) -> None:
-    assert env == Environment(
-        debug=True,
-        preferences_file=PosixPath("/Users/Crayons/Dropbox/Alfred/Alfred.alfredpreferences"),
-        preferences_localhash="adbd4f66bc3ae8493832af61a41ee609b20d8705",
-        version="5.5",
-        version_build="2058",
-        workflow_name="Google Suggest",
-        workflow_version="1.7",
-        workflow_bundleid="com.alfredapp.googlesuggest",
-        workflow_uid="user.workflow.B0AC54EC-601C-479A-9428-01F9FD732959",
-        workflow_cache=PosixPath(
-            "/Users/Crayons/Library/Caches/com.runningwithcrayons.Alfred/Workflow Data/com.alfredapp.googlesuggest"
-        ),
-        workflow_data=PosixPath(
-            "/Users/Crayons/Library/Application Support/Alfred/Workflow Data/com.alfredapp.googlesuggest"
-        ),
-        theme="alfred.theme.yosemite",
-        theme_background="rgba(255,255,255,0.98)",
-        theme_selection_background="rgba(0,0,0,0.98)",
-        theme_subtext="3",
-        workflow_description="A workflow description",
-        workflow_keyword="goog",
-    )
-
-
-def test_decorator(capsys, monkeypatch):
+    assert env == _EXPECTED_ENV
+
+
+_HELLO_OUTPUT = ScriptFilterOutput(
+    items=[OutputItem(title="Hello Alfred!")],
+    rerun=2.0,
+    cache=CacheConfig(seconds=10),
+)
+_HELLO_OUTPUT_JSON = {
+    "items": [{"title": "Hello Alfred!", "type": "default"}],
+    "rerun": 2.0,
+    "cache": {"seconds": 10},
+}
+
+
+def test_decorator(capfdbinary):
     @script_filter
     def under_test(path, args, env):
         assert path.exists()
         assert isinstance(args, list)
         _assert_env(env)
-        return ScriptFilterOutput(
-            items=[OutputItem(title="Hello Alfred!")],
-            rerun=2.0,
-            cache=CacheConfig(seconds=10),
-        )
+        return _HELLO_OUTPUT
+
+    under_test()
+
+    output = json.loads(capfdbinary.readouterr().out)
+
+    assert output == _HELLO_OUTPUT_JSON
+
+
+def test_decorator_without_orjson(capsys, monkeypatch):
+    monkeypatch.setattr("pyfred.workflow.orjson", None)
+
+    @script_filter
+    def under_test(path, args, env):
+        return _HELLO_OUTPUT
 
     under_test()
 
     output = json.loads(capsys.readouterr().out)
 
-    assert output == {
-        "items": [{"title": "Hello Alfred!", "type": "default"}],
-        "rerun": 2.0,
-        "cache": {"seconds": 10},
-    }
+    assert output == _HELLO_OUTPUT_JSON
+
+
+def _assert_inputs(path, args, env) -> None:
+    assert path.exists()
+    assert isinstance(args, list)
+    _assert_env(env)
+
+
+def _returns_tuple(path, args, env) -> tuple[str, ...]:
+    _assert_inputs(path, args, env)
+    return ("abc", "def")
+
+
+def _returns_list(path, args, env) -> list[str]:
+    _assert_inputs(path, args, env)
+    return ["abc", "def"]
+
+
+def _returns_list_as_string_annotation(path, args, env) -> "list[str]":
+    _assert_inputs(path, args, env)
+    return ["abc", "def"]
+
+
+def _returns_str(path, args, env) -> str:
+    _assert_inputs(path, args, env)
+    return "abc"
+
+
+def _returns_unannotated_tuple(path, args, env):
+    _assert_inputs(path, args, env)
+    return ("abc", "def")
+
+
+def _returns_unannotated_str(path, args, env):
+    _assert_inputs(path, args, env)
+    return "abc"
+
+
+def _returns_str_despite_list_annotation(path, args, env) -> list[str]:
+    _assert_inputs(path, args, env)
+    return "abc"  # type: ignore[return-value]
+
+
+def _returns_tuple_despite_list_annotation(path, args, env) -> list[str]:
+    _assert_inputs(path, args, env)
+    return ("abc", "def")  # type: ignore[return-value]
+
+
+def _returns_non_str_items_despite_list_annotation(path, args, env) -> list[str]:
+    _assert_inputs(path, args, env)
+    return ["abc", 1]  # type: ignore[list-item]
 
 
 external_script_testdata = [
-    (["abc", "def"], "abc def"),
-    ("abc", "abc"),
+    (_returns_tuple, "abc def"),
+    (_returns_list, "abc def"),
+    (_returns_list_as_string_annotation, "abc def"),
+    (_returns_str, "abc"),
+    (_returns_unannotated_tuple, "abc def"),
+    (_returns_unannotated_str, "abc"),
+    (_returns_str_despite_list_annotation, "abc"),
+    (_returns_tuple_despite_list_annotation, "abc def"),
+    (_returns_non_str_items_despite_list_annotation, "abc 1"),
 ]
 
 
-@pytest.mark.parametrize("ret,expected", external_script_testdata)
-def test_external_script_decorator(capsys, monkeypatch, ret, expected):
-    @external_script
-    def under_test(path, args, env):
-        assert path.exists()
-        assert isinstance(args, list)
-        _assert_env(env)
-        return ret
-
-    under_test()
+@pytest.mark.parametrize(
+    "fn,expected",
+    external_script_testdata,
+    ids=[
+        "tuple-join",
+        "list-join",
+        "string-annotation-join",
+        "str-passthrough",
+        "unannotated-join",
+        "unannotated-str",
+        "mismatched-str",
+        "mismatched-tuple",
+        "mismatched-items",
+    ],
+)
+def test_external_script_decorator(capsys, fn, expected):
+    external_script(fn)()
 
     output = capsys.readouterr().out
 
     assert output == expected
+
+
+def test_external_script_decorator_rejects_unsupported_type():
+    def under_test(path, args, env):
+        return 42
+
+    with pytest.raises(SystemExit) as excinfo:
+        external_script(under_test)()
+
+    assert excinfo.value.code == 1
@@ -2,10 +2,20 @@ import json
 import logging
 import sys
 from pathlib import Path
-from typing import Any, Callable, Optional, Union
+from typing import Callable, Optional, Union
 
 from pyfred.model import Environment, ScriptFilterOutput
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+if orjson is not None:
+    # End the output with a newline like print()
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+
 
 def script_filter(fn: Callable[[Path, list[str], Optional[Environment]], ScriptFilterOutput]):
     """
@@ -26,9 +36,6 @@ def script_filter(fn: Callable[[Path, list[str], Optional[Environment]], ScriptF
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
-    def vars_if_set(obj: Any) -> dict:
-        return {k: v for k, v in vars(obj).items() if v is not None}
-
     def decorator():
         output = fn(Path(path), args, alfred_environment)
 
@@ -42,12 +49,21 @@ def script_filter(fn: Callable[[Path, list[str], Optional[Environment]], ScriptF
             logging.debug("Unexpected instance of type %s: %s", type(output), repr(output))
             exit(1)
 
-        print(json.dumps(output, default=vars_if_set))
+        if orjson is None:
+            print(json.dumps(output.to_dict()))
+            return
+
+        # Write the encoded bytes directly instead of decoding them for print() only to have them encoded again
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(output.to_dict(), option=_ORJSON_OPTIONS))
+        sys.stdout.buffer.flush()
 
     return decorator
 
 
-def external_script(fn: Callable[[Path, list[str], Optional[Environment]], Union[str, list[str]]]):
+def external_script(
+    fn: Callable[[Path, list[str], Optional[Environment]], Union[str, list[str], tuple[str, ...]]],
+):
     """
     Decorator for an external script
 
@@ -68,7 +84,7 @@ def external_script(fn: Callable[[Path, list[str], Optional[Environment]], Union
     def decorator():
         output = fn(Path(path), args, alfred_environment)
 
-        if not isinstance(output, str) and not isinstance(output, list):
+        if not isinstance(output, (str, list, tuple)):
             logging.error(
                 "The workflow returned an unexpected type: %s, but expected %s.%s.",
                 type(output),
@@ -78,7 +94,7 @@ def external_script(fn: Callable[[Path, list[str], Optional[Environment]], Union
             logging.debug("Unexpected instance of type %s: %s", type(output), repr(output))
             exit(1)
 
-        if isinstance(output, list):
+        if isinstance(output, (list, tuple)):
             print(*output, end="")
         else:
             print(output, end="")